@@ -21,7 +21,8 @@ sys.path.insert(0, str(Path(__file__).parent / "modules"))
 
 from core.banner import print_banner
 from core.logger import setup_logger
-from core.config import Config
+from core.config import get_config
+from core.http import close_shared_session
 from engines.username_hunter import UsernameHunter
 from engines.email_hunter import EmailHunter
 from engines.social_media import SocialMediaHunter
@@ -31,7 +32,7 @@ from utils.validator import Validator
 
 class Gotcha:
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = setup_logger()
         self.reporter = Reporter()
         
@@ -116,6 +117,11 @@ class Gotcha:
                 await email_hunter.close_session()
             except Exception as e:
                 self.logger.warning(f"Error closing email hunter session: {str(e)}")
+            
+            try:
+                await breach_checker.close_session()
+            except Exception as e:
+                self.logger.warning(f"Error closing breach checker session: {str(e)}")
         
         return results
 
@@ -229,9 +235,15 @@ Note: Use --adult flag to include adult/NSFW platforms (18+ content)
             else:
                 gotcha.reporter.print_report(results, args.quiet)
     
+    async def run():
+        try:
+            await run_scan()
+        finally:
+            await close_shared_session()
+    
     # Run the async scan
     try:
-        asyncio.run(run_scan())
+        asyncio.run(run())
     except KeyboardInterrupt:
         print("\n[!] Scan interrupted by user")
         sys.exit(1)
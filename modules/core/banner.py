@@ -2,17 +2,19 @@
 Banner module for Gotcha! OSINT tool
 """
 
+import os
 import random
+import sys
 from colorama import Fore, Style, init
 
-# Initialize colorama
-init()
+# Initialize colorama only where it is needed: Windows consoles need ANSI
+# conversion and redirected output needs the codes stripped. On a POSIX
+# terminal the stdout wrapper would only add per-write overhead.
+if os.name == 'nt' or not (sys.stdout and sys.stdout.isatty()):
+    init()
 
-def print_banner():
-    """Print the Gotcha! banner"""
-    
-    banners = [
-        f"""
+_BANNERS = (
+    f"""
 {Fore.RED}
  ██████╗  ██████╗ ████████╗ ██████╗██╗  ██╗ █████╗ ██╗
 ██╔════╝ ██╔═══██╗╚══██╔══╝██╔════╝██║  ██║██╔══██╗██║
@@ -21,8 +23,8 @@ def print_banner():
 ╚██████╔╝╚██████╔╝   ██║   ╚██████╗██║  ██║██║  ██║██╗
  ╚═════╝  ╚═════╝    ╚═╝    ╚═════╝╚═╝  ╚═╝╚═╝  ╚═╝╚═╝
 {Style.RESET_ALL}""",
-        
-        f"""
+
+    f"""
 {Fore.CYAN}
   ____       _       _           _ 
  / ___| ___ | |_ ___| |__   __ _| |
@@ -30,17 +32,24 @@ def print_banner():
 | |_| | (_) | || (__| | | | (_| |_|
  \____|\___/ \__\___|_| |_|\__,_(_)
 {Style.RESET_ALL}""",
-        
-        f"""
+
+    f"""
 {Fore.YELLOW}
    ___      _       _           _ 
   / __|___ | |_ ___| |_  __ _  | |
  | (_ / _ \|  _/ __| ' \/ _` | |_|
   \___\___/ \__\___|_||_\__,_| (_)
 {Style.RESET_ALL}"""
-    ]
-    
-    print(random.choice(banners))
+)
+
+_SUCCESS = f"{Fore.GREEN}[+] %s{Style.RESET_ALL}"
+_WARNING = f"{Fore.YELLOW}[!] %s{Style.RESET_ALL}"
+_ERROR = f"{Fore.RED}[-] %s{Style.RESET_ALL}"
+_INFO = f"{Fore.BLUE}[*] %s{Style.RESET_ALL}"
+
+def print_banner():
+    """Print the Gotcha! banner"""
+    print(random.choice(_BANNERS))
     print(f"{Fore.GREEN}[+] Advanced Username & Email OSINT Tool{Style.RESET_ALL}")
     print(f"{Fore.BLUE}[+] Version: 1.0.0{Style.RESET_ALL}")
     print(f"{Fore.MAGENTA}[+] Author: Security Research Team{Style.RESET_ALL}")
@@ -54,16 +63,16 @@ def print_section_header(title):
 
 def print_success(message):
     """Print success message"""
-    print(f"{Fore.GREEN}[+] {message}{Style.RESET_ALL}")
+    print(_SUCCESS % (message,))
 
 def print_warning(message):
     """Print warning message"""
-    print(f"{Fore.YELLOW}[!] {message}{Style.RESET_ALL}")
+    print(_WARNING % (message,))
 
 def print_error(message):
     """Print error message"""
-    print(f"{Fore.RED}[-] {message}{Style.RESET_ALL}")
+    print(_ERROR % (message,))
 
 def print_info(message):
     """Print info message"""
-    print(f"{Fore.BLUE}[*] {message}{Style.RESET_ALL}")
\ No newline at end of file
+    print(_INFO % (message,))
\ No newline at end of file
@@ -2,16 +2,30 @@
 Configuration module for Gotcha! OSINT tool
 """
 
+import atexit
+import functools
 import json
+import os
+import tempfile
 from pathlib import Path
 from typing import Dict, Any
 
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 class Config:
     """Configuration manager for Gotcha!"""
     
     def __init__(self, config_file: str = "config.json"):
         self.config_file = Path(config_file)
+        self._dirty = False
         self.config = self.load_config()
+        self._refresh()
+        
+        # Changes made through set() are written once, at exit at the latest
+        atexit.register(self.save)
     
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from file"""
@@ -65,16 +79,20 @@ class Config:
                 "enabled": True,
                 "sources": [
                     "haveibeenpwned", "dehashed", "intelx", "breachdirectory"
-                ]
+                ],
+                "hibp_api_key": None,
+                "enable_local_files": False,
+                "enable_pastebins": False,
+                "enable_social_media_breaches": False
             }
         }
         
         if self.config_file.exists():
             try:
-                with open(self.config_file, 'r') as f:
-                    loaded_config = json.load(f)
-                    # Merge with default config
-                    return {**default_config, **loaded_config}
+                data = self.config_file.read_bytes()
+                loaded_config = orjson.loads(data) if orjson else json.loads(data)
+                # Merge with default config
+                return {**default_config, **loaded_config}
             except (json.JSONDecodeError, FileNotFoundError):
                 pass
         
@@ -87,21 +105,62 @@ class Config:
         if config is None:
             config = self.config
         
-        with open(self.config_file, 'w') as f:
-            json.dump(config, f, indent=2)
+        if orjson:
+            data = orjson.dumps(config, option=orjson.OPT_INDENT_2)
+        else:
+            data = json.dumps(config, indent=2).encode()
+        
+        # Write to a temporary file next to the config and swap it in, so an
+        # interrupted save never leaves a truncated config.json behind
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.config_file.parent, prefix=f".{self.config_file.name}.", suffix=".tmp"
+        )
+        try:
+            # mkstemp creates the file as 0600; keep the existing file's mode,
+            # or the umask default for a new file, as a plain open() would
+            try:
+                mode = self.config_file.stat().st_mode & 0o777
+            except FileNotFoundError:
+                umask = os.umask(0)
+                os.umask(umask)
+                mode = 0o666 & ~umask
+            os.chmod(fd, mode)
+            
+            with os.fdopen(fd, 'wb') as f:
+                f.write(data)
+            os.replace(tmp_path, self.config_file)
+        except BaseException:
+            os.unlink(tmp_path)
+            raise
+    
+    def save(self):
+        """Save pending changes made through set()"""
+        if self._dirty:
+            self.save_config()
+            self._dirty = False
+    
+    def _refresh(self):
+        """Rebuild the flattened lookup table and cached settings"""
+        self._flat = {}
+        self._flatten(self.config)
+        
+        self.user_agents = self._flat.get('user_agents', [])
+        self.timeout = self._flat.get('timeout', 10)
+        self.max_workers = self._flat.get('max_workers', 50)
+        self.delay_between_requests = self._flat.get('delay_between_requests', 0.1)
+        self.max_retries = self._flat.get('max_retries', 3)
+    
+    def _flatten(self, config: Dict[str, Any], prefix: str = ''):
+        """Index every value, including nested sections, by its dotted key"""
+        for k, v in config.items():
+            key = prefix + k
+            self._flat[key] = v
+            if isinstance(v, dict):
+                self._flatten(v, key + '.')
     
     def get(self, key: str, default: Any = None):
         """Get configuration value"""
-        keys = key.split('.')
-        value = self.config
-        
-        for k in keys:
-            if isinstance(value, dict) and k in value:
-                value = value[k]
-            else:
-                return default
-        
-        return value
+        return self._flat.get(key, default)
     
     def set(self, key: str, value: Any):
         """Set configuration value"""
@@ -114,29 +173,10 @@ class Config:
             config = config[k]
         
         config[keys[-1]] = value
-        self.save_config()
-    
-    @property
-    def user_agents(self):
-        """Get list of user agents"""
-        return self.get('user_agents', [])
-    
-    @property
-    def timeout(self):
-        """Get request timeout"""
-        return self.get('timeout', 10)
-    
-    @property
-    def max_workers(self):
-        """Get maximum number of workers"""
-        return self.get('max_workers', 50)
-    
-    @property
-    def delay_between_requests(self):
-        """Get delay between requests"""
-        return self.get('delay_between_requests', 0.1)
-    
-    @property
-    def max_retries(self):
-        """Get maximum number of retries"""
-        return self.get('max_retries', 3)
\ No newline at end of file
+        self._dirty = True
+        self._refresh()
+
+@functools.lru_cache(maxsize=None)
+def get_config(config_file: str = "config.json") -> Config:
+    """Get the shared configuration instance (parsed once per process)"""
+    return Config(config_file)
@@ -0,0 +1,78 @@
+"""
+HTTP session module for Gotcha! OSINT tool
+"""
+
+import json
+import random
+import aiohttp
+from typing import Optional
+from core.config import get_config
+
+try:
+    import aiodns
+except ImportError:
+    aiodns = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Decoder for response.json(); orjson parses the raw body several times
+# faster than the stdlib module
+json_loads = orjson.loads if orjson else json.loads
+
+_session: Optional[aiohttp.ClientSession] = None
+_holders = 0
+
+async def get_shared_session() -> aiohttp.ClientSession:
+    """Get the process-wide aiohttp session, creating it on first use"""
+    global _session
+    
+    if _session is None or _session.closed:
+        config = get_config()
+        
+        timeout = aiohttp.ClientTimeout(total=config.timeout)
+        connector = aiohttp.TCPConnector(
+            limit=config.max_workers,
+            limit_per_host=10,
+            ttl_dns_cache=300,
+            keepalive_timeout=60,
+            verify_ssl=config.get('verify_ssl', True),
+            # Resolve hostnames through c-ares when aiodns is installed
+            # instead of getaddrinfo on the default thread pool
+            resolver=aiohttp.AsyncResolver() if aiodns else None
+        )
+        
+        _session = aiohttp.ClientSession(
+            timeout=timeout,
+            connector=connector,
+            headers={
+                'User-Agent': random.choice(config.user_agents)
+            }
+        )
+    
+    return _session
+
+async def acquire_shared_session() -> aiohttp.ClientSession:
+    """Get the shared session and register the caller as a holder"""
+    global _holders
+    
+    _holders += 1
+    return await get_shared_session()
+
+async def release_shared_session():
+    """Unregister a holder, closing the shared session when none remain"""
+    global _holders
+    
+    _holders = max(_holders - 1, 0)
+    if not _holders:
+        await close_shared_session()
+
+async def close_shared_session():
+    """Close the process-wide aiohttp session"""
+    global _session
+    
+    if _session is not None:
+        await _session.close()
+        _session = None
@@ -2,18 +2,31 @@
 Logger module for Gotcha! OSINT tool
 """
 
+import atexit
 import logging
+import queue
 import sys
 from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
 from pathlib import Path
 
+class LazyFileHandler(logging.FileHandler):
+    """File handler that creates its directory and file on the first record"""
+    
+    def __init__(self, filename, mode='a', encoding=None):
+        super().__init__(filename, mode, encoding, delay=True)
+    
+    def _open(self):
+        Path(self.baseFilename).parent.mkdir(parents=True, exist_ok=True)
+        return super()._open()
+
+_FORMATTER = logging.Formatter(
+    '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+)
+
 def setup_logger(name="gotcha", level=logging.INFO):
     """Setup and configure logger"""
     
-    # Create logs directory if it doesn't exist
-    logs_dir = Path("logs")
-    logs_dir.mkdir(exist_ok=True)
-    
     # Create logger
     logger = logging.getLogger(name)
     logger.setLevel(level)
@@ -22,27 +35,32 @@ def setup_logger(name="gotcha", level=logging.INFO):
     if logger.handlers:
         return logger
     
-    # Create formatter
-    formatter = logging.Formatter(
-        '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-    )
+    logs_dir = Path("logs")
     
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setLevel(logging.INFO)
-    console_handler.setFormatter(formatter)
+    console_handler.setFormatter(_FORMATTER)
     
     # File handler
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
-    file_handler = logging.FileHandler(
+    file_handler = LazyFileHandler(
         logs_dir / f"gotcha_{timestamp}.log"
     )
     file_handler.setLevel(logging.DEBUG)
-    file_handler.setFormatter(formatter)
+    file_handler.setFormatter(_FORMATTER)
+    
+    # Write records from a background thread so logging calls made on the
+    # event loop only enqueue the record instead of blocking on I/O
+    log_queue = queue.Queue(-1)
+    listener = QueueListener(
+        log_queue, console_handler, file_handler, respect_handler_level=True
+    )
+    listener.start()
+    atexit.register(listener.stop)
     
     # Add handlers to logger
-    logger.addHandler(console_handler)
-    logger.addHandler(file_handler)
+    logger.addHandler(QueueHandler(log_queue))
     
     return logger
 
@@ -5,100 +5,209 @@ Breach Checker - Check for email addresses in data breaches
 import asyncio
 import aiohttp
 import hashlib
-import random
+import re
+from bisect import bisect_right
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from types import MappingProxyType
 from typing import List, Dict, Any, Optional
-from core.config import Config
+from urllib.parse import quote
+from core.config import get_config
+from core.http import acquire_shared_session, release_shared_session, json_loads
 from core.logger import get_logger
 
+# Known breach databases that can be checked without API keys
+_BREACH_SOURCES = MappingProxyType({
+    'dehashed': MappingProxyType({
+        'name': 'DeHashed',
+        'url': 'https://www.dehashed.com/search',
+        'requires_api': True,
+        'description': 'Database of leaked credentials'
+    }),
+    'haveibeenpwned': MappingProxyType({
+        'name': 'Have I Been Pwned',
+        'url': 'https://haveibeenpwned.com/api/v3/breachedaccount',
+        'requires_api': False,
+        'description': 'Troy Hunt\'s breach database'
+    }),
+    'intelx': MappingProxyType({
+        'name': 'Intelligence X',
+        'url': 'https://intelx.io/search',
+        'requires_api': True,
+        'description': 'OSINT search engine'
+    }),
+    'breachdirectory': MappingProxyType({
+        'name': 'Breach Directory',
+        'url': 'https://breachdirectory.org/search',
+        'requires_api': False,
+        'description': 'Free breach lookup service'
+    })
+})
+
+# Common breach patterns and indicators
+_BREACH_INDICATORS = (
+    'breach', 'leaked', 'dump', 'database', 'credentials',
+    'password', 'hack', 'compromise', 'exposure'
+)
+
+# Known major breaches that can be checked
+_KNOWN_BREACHES = MappingProxyType({
+    'linkedin_2012': MappingProxyType({
+        'name': 'LinkedIn (2012)',
+        'description': '6.5M LinkedIn passwords',
+        'date': '2012-06-05'
+    }),
+    'adobe_2013': MappingProxyType({
+        'name': 'Adobe (2013)',
+        'description': '153M Adobe accounts',
+        'date': '2013-10-03'
+    }),
+    'yahoo_2013': MappingProxyType({
+        'name': 'Yahoo (2013)',
+        'description': '3B Yahoo accounts',
+        'date': '2013-08-01'
+    }),
+    'equifax_2017': MappingProxyType({
+        'name': 'Equifax (2017)',
+        'description': '147M Equifax records',
+        'date': '2017-07-29'
+    }),
+    'facebook_2019': MappingProxyType({
+        'name': 'Facebook (2019)',
+        'description': '533M Facebook users',
+        'date': '2019-04-01'
+    })
+})
+
+# Compiled once so responses are scanned in a single case-insensitive pass
+_HIBP_INDICATORS = (b'pwned', b'breach', b'found')
+_HIBP_RE = re.compile(b'|'.join(_HIBP_INDICATORS), re.I)
+_HIBP_CARRY = max(len(indicator) for indicator in _HIBP_INDICATORS) - 1
+
+# Breach counts at which the risk level steps up to Low, Medium and High
+_RISK_THRESHOLDS = (1, 2, 5)
+_RISK_LEVELS = ('Clean', 'Low', 'Medium', 'High')
+
+_RECOMMENDATIONS = (
+    'Change passwords for all accounts associated with this email',
+    'Enable two-factor authentication where possible',
+    'Monitor accounts for suspicious activity',
+    'Consider using a password manager',
+    'Check credit reports for unauthorized accounts'
+)
+
 class BreachChecker:
     """Check for email addresses in known data breaches"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = get_logger()
         self.session = None
         
-        # Known breach databases that can be checked without API keys
-        self.breach_sources = {
-            'dehashed': {
-                'name': 'DeHashed',
-                'url': 'https://www.dehashed.com/search',
-                'requires_api': True,
-                'description': 'Database of leaked credentials'
-            },
-            'haveibeenpwned': {
-                'name': 'Have I Been Pwned',
-                'url': 'https://haveibeenpwned.com/api/v3/breachedaccount',
-                'requires_api': False,
-                'description': 'Troy Hunt\'s breach database'
-            },
-            'intelx': {
-                'name': 'Intelligence X',
-                'url': 'https://intelx.io/search',
-                'requires_api': True,
-                'description': 'OSINT search engine'
-            },
-            'breachdirectory': {
-                'name': 'Breach Directory',
-                'url': 'https://breachdirectory.org/search',
-                'requires_api': False,
-                'description': 'Free breach lookup service'
-            }
-        }
+        self.breach_sources = _BREACH_SOURCES
+        self.breach_indicators = _BREACH_INDICATORS
         
-        # Common breach patterns and indicators
-        self.breach_indicators = [
-            'breach', 'leaked', 'dump', 'database', 'credentials',
-            'password', 'hack', 'compromise', 'exposure'
-        ]
+        # Requests to the same breach source are paced one at a time, while
+        # different sources are still checked in parallel
+        self._host_locks = defaultdict(lambda: asyncio.Semaphore(1))
+    
+    async def __aenter__(self):
+        await self.create_session()
+        return self
+    
+    async def __aexit__(self, exc_type, exc, tb):
+        await self.close_session()
     
     async def create_session(self):
-        """Create aiohttp session"""
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-        connector = aiohttp.TCPConnector(
-            limit=self.config.max_workers,
-            verify_ssl=self.config.get('verify_ssl', True)
-        )
-        
-        self.session = aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-            headers={
-                'User-Agent': random.choice(self.config.user_agents)
-            }
-        )
+        """Attach the shared aiohttp session"""
+        if not self.session:
+            self.session = await acquire_shared_session()
     
     async def close_session(self):
-        """Close aiohttp session"""
+        """Release the shared aiohttp session
+        
+        The session is closed once no engine holds it any more.
+        """
         if self.session:
-            await self.session.close()
             self.session = None
+            await release_shared_session()
+    
+    @asynccontextmanager
+    async def _paced(self, host: str):
+        """Hold the host's lock for a request and delay_between_requests after it"""
+        async with self._host_locks[host]:
+            try:
+                yield
+            finally:
+                await asyncio.sleep(self.config.delay_between_requests)
     
     def get_sha1_hash(self, email: str) -> str:
         """Generate SHA1 hash for email"""
         return hashlib.sha1(email.lower().strip().encode()).hexdigest()
     
+    def hash_many(self, emails: List[str]) -> List[str]:
+        """Generate SHA1 hashes for a list of emails in one pass"""
+        sha1 = hashlib.sha1
+        return [sha1(email.lower().strip().encode()).digest().hex() for email in emails]
+    
     async def check_haveibeenpwned(self, email: str) -> Optional[Dict[str, Any]]:
         """Check Have I Been Pwned for breaches"""
         try:
-            # Note: HIBP API v3 requires API key for email searches
-            # This is a demonstration of how it would work
-            url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{email}"
-            
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'hibp-api-key': 'YOUR_API_KEY_HERE'  # Would need real API key
-            }
-            
-            # For demo purposes, we'll check the website directly
             web_url = f"https://haveibeenpwned.com/account/{email}"
             
-            async with self.session.get(web_url) as response:
+            # HIBP API v3 requires an API key for email searches, but returns
+            # a small JSON list of breach names instead of a full HTML page
+            api_key = self.config.get('breach_check.hibp_api_key')
+            if api_key:
+                url = f"https://haveibeenpwned.com/api/v3/breachedaccount/{quote(email)}"
+                headers = {'hibp-api-key': api_key}
+                
+                async with self._paced('haveibeenpwned.com'):
+                    for attempt in range(2):
+                        async with self.session.get(url, headers=headers) as response:
+                            if response.status == 200:
+                                breaches = await response.json(loads=json_loads)
+                                return {
+                                    'source': 'Have I Been Pwned',
+                                    'email': email,
+                                    'found': True,
+                                    'breaches': [breach.get('Name', '') for breach in breaches],
+                                    'url': web_url
+                                }
+                            
+                            # 404 means the account is not in any breach
+                            if response.status == 404:
+                                return None
+                            
+                            # Rate limited: wait as long as HIBP asks, then retry once
+                            if response.status == 429 and attempt == 0:
+                                retry_after = response.headers.get('Retry-After', '')
+                                retry_after = int(retry_after) if retry_after.isdigit() else 1
+                            else:
+                                # Anything else must not look like a clean result
+                                raise aiohttp.ClientResponseError(
+                                    response.request_info, response.history,
+                                    status=response.status, message='Unexpected response'
+                                )
+                        
+                        await asyncio.sleep(retry_after)
+            
+            # Without an API key, check the website directly
+            async with self._paced('haveibeenpwned.com'), self.session.get(web_url) as response:
                 if response.status == 200:
-                    content = await response.text()
+                    # Look for breach indicators as the body streams in and stop
+                    # reading at the first match. A short tail of the previous
+                    # chunk is kept so matches across chunk boundaries are found.
+                    found = False
+                    tail = b''
+                    async for chunk in response.content.iter_chunked(8192):
+                        window = tail + chunk
+                        if _HIBP_RE.search(window):
+                            found = True
+                            break
+                        tail = window[-_HIBP_CARRY:]
                     
-                    # Look for breach indicators in the response
-                    if any(indicator in content.lower() for indicator in ['pwned', 'breach', 'found']):
+                    if found:
                         return {
                             'source': 'Have I Been Pwned',
                             'email': email,
@@ -108,6 +217,9 @@ class BreachChecker:
                             'note': 'Manual verification required - automated checking requires API key'
                         }
                     
+        except aiohttp.ClientResponseError:
+            # Let check_breaches record the source as failed
+            raise
         except Exception as e:
             self.logger.error(f"Error checking Have I Been Pwned for {email}: {str(e)}")
         
@@ -128,7 +240,6 @@ class BreachChecker:
             }
             
             headers = {
-                'User-Agent': random.choice(self.config.user_agents),
                 'Content-Type': 'application/x-www-form-urlencoded',
                 'Referer': 'https://breachdirectory.org/'
             }
@@ -200,35 +311,7 @@ class BreachChecker:
     async def check_social_media_breaches(self, email: str) -> List[Dict[str, Any]]:
         """Check for email in known social media breaches"""
         results = []
-        
-        # Known major breaches that can be checked
-        known_breaches = {
-            'linkedin_2012': {
-                'name': 'LinkedIn (2012)',
-                'description': '6.5M LinkedIn passwords',
-                'date': '2012-06-05'
-            },
-            'adobe_2013': {
-                'name': 'Adobe (2013)',
-                'description': '153M Adobe accounts',
-                'date': '2013-10-03'
-            },
-            'yahoo_2013': {
-                'name': 'Yahoo (2013)',
-                'description': '3B Yahoo accounts',
-                'date': '2013-08-01'
-            },
-            'equifax_2017': {
-                'name': 'Equifax (2017)',
-                'description': '147M Equifax records',
-                'date': '2017-07-29'
-            },
-            'facebook_2019': {
-                'name': 'Facebook (2019)',
-                'description': '533M Facebook users',
-                'date': '2019-04-01'
-            }
-        }
+        known_breaches = _KNOWN_BREACHES
         
         # Note: Actual checking would require access to breach databases
         # This is for demonstration purposes only
@@ -238,96 +321,89 @@ class BreachChecker:
     async def generate_breach_report(self, email: str, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate comprehensive breach report"""
         
+        breach_sources = [result['source'] for result in results]
+        total = len(breach_sources)
+        
         breach_report = {
             'email': email,
-            'total_breaches_found': len(results),
-            'breach_sources': [],
+            'total_breaches_found': total,
+            'breach_sources': breach_sources,
             'risk_level': 'Unknown',
             'recommendations': [],
             'last_checked': None
         }
         
-        if results:
-            breach_report['breach_sources'] = [result['source'] for result in results]
-            
-            # Determine risk level based on number and severity of breaches
-            if len(results) >= 5:
-                breach_report['risk_level'] = 'High'
-            elif len(results) >= 2:
-                breach_report['risk_level'] = 'Medium'
-            elif len(results) >= 1:
-                breach_report['risk_level'] = 'Low'
-            else:
-                breach_report['risk_level'] = 'Clean'
-            
-            # Generate recommendations
-            if results:
-                breach_report['recommendations'] = [
-                    'Change passwords for all accounts associated with this email',
-                    'Enable two-factor authentication where possible',
-                    'Monitor accounts for suspicious activity',
-                    'Consider using a password manager',
-                    'Check credit reports for unauthorized accounts'
-                ]
+        if total:
+            # Determine risk level based on number of breaches
+            breach_report['risk_level'] = _RISK_LEVELS[bisect_right(_RISK_THRESHOLDS, total)]
+            breach_report['recommendations'] = _RECOMMENDATIONS
         
         return breach_report
     
     async def check_breaches(self, email: str) -> Dict[str, Any]:
-        """Check all available breach sources for email"""
+        """Check all available breach sources for email
+        
+        The session is kept open so it can be reused across emails.
+        """
         if not self.session:
             await self.create_session()
         
         self.logger.info(f"Checking breaches for email: {email}")
         
-        try:
-            results = []
-            
-            # Check various sources
-            checks = [
-                self.check_haveibeenpwned(email),
-                self.check_breachdirectory(email)
-            ]
-            
-            for check in checks:
-                try:
-                    result = await check
-                    if result:
-                        results.append(result)
-                    
-                    # Add delay between checks
-                    await asyncio.sleep(self.config.delay_between_requests)
-                except Exception as e:
-                    self.logger.error(f"Error in breach check: {str(e)}")
-            
-            # Check local files and pastebins
-            local_results = await self.check_local_breach_files(email)
-            paste_results = await self.check_pastebins(email)
-            social_results = await self.check_social_media_breaches(email)
-            
-            results.extend(local_results)
-            results.extend(paste_results)
-            results.extend(social_results)
-            
-            # Generate comprehensive report
-            report = await self.generate_breach_report(email, results)
-            
-            self.logger.info(f"Breach check complete for {email}: {len(results)} potential breaches found")
-            
-            return report
-        finally:
-            # Ensure session is closed
-            try:
-                await self.close_session()
-            except Exception as e:
-                self.logger.warning(f"Error closing breach checker session: {str(e)}")
+        results = []
+        errors = []
+        
+        # Check all sources concurrently
+        checks = [
+            self.check_haveibeenpwned(email),
+            self.check_breachdirectory(email)
+        ]
+        
+        # Placeholder sources are only scheduled when explicitly enabled
+        if self.config.get('breach_check.enable_local_files', False):
+            checks.append(self.check_local_breach_files(email))
+        if self.config.get('breach_check.enable_pastebins', False):
+            checks.append(self.check_pastebins(email))
+        if self.config.get('breach_check.enable_social_media_breaches', False):
+            checks.append(self.check_social_media_breaches(email))
+        
+        for result in await asyncio.gather(*checks, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in breach check for {email}: {str(result)}")
+                errors.append(str(result))
+            elif isinstance(result, list):
+                results.extend(result)
+            elif result:
+                results.append(result)
+        
+        # Generate comprehensive report
+        report = await self.generate_breach_report(email, results)
+        if errors:
+            report['errors'] = errors
+        
+        self.logger.info(f"Breach check complete for {email}: {len(results)} potential breaches found")
+        
+        return report
     
     async def bulk_check_breaches(self, emails: List[str]) -> Dict[str, Dict[str, Any]]:
         """Check multiple emails for breaches"""
-        results = {}
+        semaphore = asyncio.Semaphore(self.config.max_workers)
+        
+        async def check_one(email: str) -> Dict[str, Any]:
+            async with semaphore:
+                return await self.check_breaches(email)
+        
+        if not self.session:
+            await self.create_session()
+        
+        # Addresses that only differ in case or surrounding whitespace hash the
+        # same, so each distinct account is checked once
+        unique = {}
+        hashes = self.hash_many(emails)
+        for email, email_hash in zip(emails, hashes):
+            unique.setdefault(email_hash, email)
         
-        for email in emails:
-            results[email] = await self.check_breaches(email)
-            # Add delay between bulk checks
-            await asyncio.sleep(self.config.delay_between_requests * 2)
+        reports = await asyncio.gather(*(check_one(email) for email in unique.values()))
+        reports_by_hash = dict(zip(unique, reports))
         
-        return results
\ No newline at end of file
+        return {email: reports_by_hash[email_hash] for email, email_hash in zip(emails, hashes)}
@@ -4,156 +4,266 @@ Email Hunter - Find accounts associated with email addresses
 
 import asyncio
 import aiohttp
-import random
+import copy
+import functools
+import hashlib
+import itertools
 import re
-import socket
+import time
+import dns.asyncresolver
 import dns.resolver
-from typing import List, Dict, Any, Optional
+from collections import defaultdict
+from contextlib import asynccontextmanager
+from types import MappingProxyType
+from typing import List, Dict, Any, Optional, Tuple
 from urllib.parse import urlparse, urljoin
-from core.config import Config
+from core.config import get_config
+from core.http import acquire_shared_session, release_shared_session, json_loads
 from core.logger import get_logger
 
+@functools.lru_cache(maxsize=None)
+def _get_resolver() -> dns.asyncresolver.Resolver:
+    """Get the shared async DNS resolver, reading the system config once"""
+    resolver = dns.asyncresolver.Resolver()
+    resolver.lifetime = 5
+    # Answers are reused for their DNS TTL, so emails on the same domain
+    # only pay for the lookups once
+    resolver.cache = dns.resolver.Cache()
+    return resolver
+
+# Known disposable email domains
+_DISPOSABLE_DOMAINS = frozenset({
+    '10minutemail.com', 'temp-mail.org', 'guerrillamail.com',
+    'mailinator.com', 'yopmail.com', 'tempmail.net'
+})
+
+# Free email providers (anything else is treated as corporate)
+_FREE_PROVIDERS = frozenset({
+    'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
+    'aol.com', 'icloud.com', 'protonmail.com'
+})
+
+# Extra request headers for each platform check, combined with every
+# configured User-Agent when an EmailHunter is created
+_HEADER_VARIANTS = {
+    'microsoft': {
+        'Content-Type': 'application/json'
+    },
+    'adobe': {
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'X-Requested-With': 'XMLHttpRequest'
+    },
+    'onlyfans': {
+        'Content-Type': 'application/json',
+        'Accept': 'application/json'
+    },
+    'pornhub': {
+        'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
+    },
+    'chaturbate': {
+        'Content-Type': 'application/x-www-form-urlencoded',
+        'Referer': 'https://chaturbate.com/auth/login/'
+    },
+    'github': {
+        'Accept': 'application/vnd.github.cloak-preview'
+    }
+}
+
+# Concurrent requests allowed to a single host
+_MAX_REQUESTS_PER_HOST = 4
+
+# Domain analysis results by domain, kept for an hour
+_DOMAIN_CACHE_TTL = 3600
+_domain_cache: Dict[str, Tuple[float, Dict[str, Any]]] = {}
+
+# Gravatar lookups by email hash, kept for an hour
+_GRAVATAR_CACHE_TTL = 3600
+_gravatar_cache: Dict[str, Tuple[float, Optional[Dict[str, Any]]]] = {}
+
+# Social platforms that allow email-based registration recovery
+_SOCIAL_PLATFORMS = MappingProxyType({
+    'gravatar': MappingProxyType({
+        'check_method': 'hash_check',
+        'url_pattern': 'https://secure.gravatar.com/avatar/{}.json',
+        'indicators': ('profile', 'gravatar')
+    }),
+    'skype': MappingProxyType({
+        'check_method': 'direct_check',
+        'url_pattern': 'https://login.skype.com/login/oauth/microsoft',
+        'check_url': 'https://login.live.com/GetCredentialType.srf',
+        'indicators': ('IfExistsResult',)
+    }),
+    'adobe': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://accounts.adobe.com/reactivate/password',
+        'form_field': 'username',
+        'form_encoding': 'data',
+        'indicators': ('password reset', 'check your email', 'reset link'),
+        'account_type': 'Adobe Account',
+        'additional_info': MappingProxyType({})
+    }),
+    'spotify': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://accounts.spotify.com/password-reset',
+        'indicators': ('reset', 'spotify')
+    }),
+    # Adult platforms (for security research)
+    'onlyfans_email': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://onlyfans.com/api2/v2/users/password/reset',
+        'form_field': 'email',
+        'form_encoding': 'json',
+        # OnlyFans typically returns success even for non-existent emails
+        # for privacy, so any 200 response counts
+        'indicators': (),
+        'account_type': 'OnlyFans Account',
+        'additional_info': MappingProxyType({'note': 'Password reset attempted - manual verification recommended'})
+    }),
+    'pornhub_email': MappingProxyType({
+        'check_method': 'registration_check',
+        'url_pattern': 'https://pornhub.com/signup',
+        'indicators': ('already', 'exists')
+    }),
+    'chaturbate_email': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://chaturbate.com/auth/password_reset/',
+        'form_field': 'email',
+        'form_encoding': 'data',
+        'indicators': ('reset', 'email', 'sent'),
+        'account_type': 'Chaturbate Account',
+        'additional_info': MappingProxyType({'note': 'Password reset attempted'})
+    }),
+    'cam4_email': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://cam4.com/password-reset',
+        'indicators': ('reset', 'email')
+    }),
+    'adultfriendfinder_email': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://adultfriendfinder.com/go/page/login_forgotpassword',
+        'indicators': ('reset', 'password')
+    })
+})
+
+# Professional platforms
+_PROFESSIONAL_PLATFORMS = MappingProxyType({
+    'github': MappingProxyType({
+        'check_method': 'api_check',
+        'url_pattern': 'https://api.github.com/search/users?q={}',
+        'indicators': ('login', 'avatar_url')
+    }),
+    'gitlab': MappingProxyType({
+        'check_method': 'password_reset',
+        'url_pattern': 'https://gitlab.com/users/password/new',
+        'indicators': ('password', 'reset')
+    }),
+    'stackoverflow': MappingProxyType({
+        'check_method': 'search_check',
+        'url_pattern': 'https://stackoverflow.com/users',
+        'search_url': 'https://api.stackexchange.com/2.3/users',
+        'indicators': ('reputation', 'user_id')
+    })
+})
+
+# Account existence indicators for each password reset check, matched
+# case-insensitively in one pass
+_RESET_INDICATORS_RE = {
+    name: re.compile('|'.join(map(re.escape, platform['indicators'])), re.I)
+    for name, platform in _SOCIAL_PLATFORMS.items()
+    if platform['check_method'] == 'password_reset' and platform['indicators']
+}
+
 class EmailHunter:
     """Hunt for accounts associated with email addresses"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = get_logger()
         self.session = None
         
-        # Social platforms that allow email-based registration recovery
-        self.social_platforms = {
-            'gravatar': {
-                'check_method': 'hash_check',
-                'url_pattern': 'https://secure.gravatar.com/avatar/{}.json',
-                'indicators': ['profile', 'gravatar']
-            },
-            'skype': {
-                'check_method': 'direct_check',
-                'url_pattern': 'https://login.skype.com/login/oauth/microsoft',
-                'check_url': 'https://login.live.com/GetCredentialType.srf',
-                'indicators': ['IfExistsResult']
-            },
-            'adobe': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://accounts.adobe.com/forgotpassword',
-                'indicators': ['password reset', 'account']
-            },
-            'spotify': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://accounts.spotify.com/password-reset',
-                'indicators': ['reset', 'spotify']
-            },
-            # Adult platforms (for security research)
-            'onlyfans_email': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://onlyfans.com/api2/v2/users/password/reset',
-                'indicators': ['reset', 'email']
-            },
-            'pornhub_email': {
-                'check_method': 'registration_check',
-                'url_pattern': 'https://pornhub.com/signup',
-                'indicators': ['already', 'exists']
-            },
-            'chaturbate_email': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://chaturbate.com/auth/password_reset/',
-                'indicators': ['reset', 'email']
-            },
-            'cam4_email': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://cam4.com/password-reset',
-                'indicators': ['reset', 'email']
-            },
-            'adultfriendfinder_email': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://adultfriendfinder.com/go/page/login_forgotpassword',
-                'indicators': ['reset', 'password']
-            }
-        }
+        # Requests to one host are capped while different hosts run freely
+        self._host_semaphores = defaultdict(lambda: asyncio.Semaphore(_MAX_REQUESTS_PER_HOST))
         
-        # Professional platforms
-        self.professional_platforms = {
-            'github': {
-                'check_method': 'api_check',
-                'url_pattern': 'https://api.github.com/search/users?q={}',
-                'indicators': ['login', 'avatar_url']
-            },
-            'gitlab': {
-                'check_method': 'password_reset',
-                'url_pattern': 'https://gitlab.com/users/password/new',
-                'indicators': ['password', 'reset']
-            },
-            'stackoverflow': {
-                'check_method': 'search_check',
-                'url_pattern': 'https://stackoverflow.com/users',
-                'search_url': 'https://api.stackexchange.com/2.3/users',
-                'indicators': ['reputation', 'user_id']
-            }
+        # Prebuilt header dicts, rotated through the user agents per request
+        self._headers = {
+            name: itertools.cycle([
+                {'User-Agent': user_agent, **extra} for user_agent in self.config.user_agents
+            ])
+            for name, extra in _HEADER_VARIANTS.items()
         }
+        
+        # Platform registries are shared, read-only module constants
+        self.social_platforms = _SOCIAL_PLATFORMS
+        self.professional_platforms = _PROFESSIONAL_PLATFORMS
     
     async def create_session(self):
-        """Create aiohttp session"""
-        timeout = aiohttp.ClientTimeout(total=self.config.timeout)
-        connector = aiohttp.TCPConnector(
-            limit=self.config.max_workers,
-            verify_ssl=self.config.get('verify_ssl', True)
-        )
-        
-        self.session = aiohttp.ClientSession(
-            timeout=timeout,
-            connector=connector,
-            headers={
-                'User-Agent': random.choice(self.config.user_agents)
-            }
-        )
+        """Attach the shared aiohttp session"""
+        if not self.session:
+            self.session = await acquire_shared_session()
     
     async def close_session(self):
-        """Close aiohttp session"""
+        """Release the shared aiohttp session"""
         if self.session:
-            await self.session.close()
             self.session = None
+            await release_shared_session()
+    
+    @asynccontextmanager
+    async def _request(self, method: str, url: str, **kwargs):
+        """Send a request while holding a slot of the target host's limit"""
+        async with self._host_semaphores[urlparse(url).hostname]:
+            async with self.session.request(method, url, **kwargs) as response:
+                yield response
     
-    def get_email_hash(self, email: str) -> str:
+    async def aclose(self):
+        """Release the session once all hunts are done"""
+        await self.close_session()
+    
+    @staticmethod
+    @functools.lru_cache(maxsize=4096)
+    def get_email_hash(email: str) -> str:
         """Generate MD5 hash for email (used by Gravatar)"""
-        import hashlib
         return hashlib.md5(email.lower().strip().encode()).hexdigest()
     
     async def check_gravatar(self, email: str) -> Optional[Dict[str, Any]]:
         """Check if email has Gravatar profile"""
         try:
             email_hash = self.get_email_hash(email)
-            url = f"https://www.gravatar.com/avatar/{email_hash}?d=404"
             
-            async with self.session.head(url) as response:
-                if response.status == 200:
-                    # Get profile info
-                    profile_url = f"https://www.gravatar.com/{email_hash}.json"
-                    async with self.session.get(profile_url) as profile_response:
-                        if profile_response.status == 200:
-                            profile_data = await profile_response.json()
-                            return {
-                                'platform': 'gravatar',
-                                'email': email,
-                                'exists': True,
-                                'profile_url': f"https://www.gravatar.com/{email_hash}",
-                                'avatar_url': f"https://www.gravatar.com/avatar/{email_hash}",
-                                'additional_info': profile_data.get('entry', [{}])[0] if profile_data.get('entry') else {}
-                            }
-                    
-                    return {
-                        'platform': 'gravatar',
-                        'email': email,
-                        'exists': True,
-                        'profile_url': f"https://www.gravatar.com/{email_hash}",
-                        'avatar_url': f"https://www.gravatar.com/avatar/{email_hash}",
-                        'additional_info': {}
-                    }
+            # Reuse recent answers for the same address, including misses
+            cached = _gravatar_cache.get(email_hash)
+            if cached and cached[0] > time.monotonic():
+                return cached[1]
+            
+            result = await self._lookup_gravatar(email, email_hash)
+            _gravatar_cache[email_hash] = (time.monotonic() + _GRAVATAR_CACHE_TTL, result)
+            return result
         except Exception as e:
             self.logger.error(f"Error checking Gravatar for {email}: {str(e)}")
         
         return None
     
+    async def _lookup_gravatar(self, email: str, email_hash: str) -> Optional[Dict[str, Any]]:
+        """Query Gravatar for an email hash
+        
+        The profile JSON endpoint answers 404 for unknown hashes, so a single
+        request both checks existence and fetches the profile.
+        """
+        profile_url = f"https://www.gravatar.com/{email_hash}.json"
+        
+        async with self._request('GET', profile_url) as response:
+            if response.status == 200:
+                profile_data = await response.json(loads=json_loads)
+                return {
+                    'platform': 'gravatar',
+                    'email': email,
+                    'exists': True,
+                    'profile_url': f"https://www.gravatar.com/{email_hash}",
+                    'avatar_url': f"https://www.gravatar.com/avatar/{email_hash}",
+                    'additional_info': profile_data.get('entry', [{}])[0] if profile_data.get('entry') else {}
+                }
+        
+        return None
+    
     async def check_microsoft_account(self, email: str) -> Optional[Dict[str, Any]]:
         """Check if email is associated with Microsoft account"""
         try:
@@ -168,14 +278,11 @@ class EmailHunter:
                 'isFidoSupported': 'false'
             }
             
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'Content-Type': 'application/json'
-            }
+            headers = next(self._headers['microsoft'])
             
-            async with self.session.post(url, json=data, headers=headers) as response:
+            async with self._request('POST', url, json=data, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await response.json(loads=json_loads)
                     if result.get('IfExistsResult') == 0:  # Account exists
                         return {
                             'platform': 'microsoft',
@@ -192,42 +299,38 @@ class EmailHunter:
         
         return None
     
+    async def _check_password_reset(self, email: str, name: str) -> Optional[Dict[str, Any]]:
+        """Submit a platform's password reset form and look for account indicators"""
+        platform = self.social_platforms[name]
+        short_name = name.removesuffix('_email')
+        
+        payload = {platform['form_encoding']: {platform['form_field']: email}}
+        headers = next(self._headers[short_name])
+        timeout = aiohttp.ClientTimeout(total=5)
+        
+        async with self._request('POST', platform['url_pattern'], headers=headers, timeout=timeout, **payload) as response:
+            indicators = _RESET_INDICATORS_RE.get(name)
+            if indicators is None:
+                exists = response.status == 200
+            else:
+                exists = indicators.search(await response.text()) is not None
+            
+            if exists:
+                return {
+                    'platform': short_name,
+                    'email': email,
+                    'exists': True,
+                    'account_type': platform['account_type'],
+                    'additional_info': dict(platform['additional_info'])
+                }
+        
+        return None
+    
     async def check_adobe_account(self, email: str) -> Optional[Dict[str, Any]]:
         """Check if email is associated with Adobe account"""
         try:
-            # First, try to resolve the domain to check connectivity
-            import socket
-            try:
-                socket.getaddrinfo('accounts.adobe.com', 443)
-            except socket.gaierror:
-                self.logger.warning(f"Cannot resolve accounts.adobe.com - skipping Adobe check for {email}")
-                return None
-            
-            # Adobe account check via password reset page
-            url = "https://accounts.adobe.com/reactivate/password"
-            data = {'username': email}
-            
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'X-Requested-With': 'XMLHttpRequest'
-            }
-            
-            # Use a shorter timeout for Adobe check
-            timeout = aiohttp.ClientTimeout(total=5)  # 5 second timeout
-            
-            async with self.session.post(url, data=data, headers=headers, timeout=timeout) as response:
-                content = await response.text()
-                
-                # Check for account existence indicators
-                if any(indicator in content.lower() for indicator in ['password reset', 'check your email', 'reset link']):
-                    return {
-                        'platform': 'adobe',
-                        'email': email,
-                        'exists': True,
-                        'account_type': 'Adobe Account',
-                        'additional_info': {}
-                    }
+            # Resolution failures surface as ClientConnectorError below
+            return await self._check_password_reset(email, 'adobe')
         except (aiohttp.ClientError, asyncio.TimeoutError) as e:
             self.logger.warning(f"Adobe account check failed for {email}: {str(e)} - skipping")
         except Exception as e:
@@ -238,29 +341,7 @@ class EmailHunter:
     async def check_onlyfans_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Check if email is associated with OnlyFans account"""
         try:
-            # OnlyFans password reset check
-            url = "https://onlyfans.com/api2/v2/users/password/reset"
-            data = {'email': email}
-            
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'Content-Type': 'application/json',
-                'Accept': 'application/json'
-            }
-            
-            timeout = aiohttp.ClientTimeout(total=5)
-            
-            async with self.session.post(url, json=data, headers=headers, timeout=timeout) as response:
-                if response.status == 200:
-                    result = await response.json()
-                    # OnlyFans typically returns success even for non-existent emails for privacy
-                    return {
-                        'platform': 'onlyfans',
-                        'email': email,
-                        'exists': True,  # Assumes existence due to privacy response
-                        'account_type': 'OnlyFans Account',
-                        'additional_info': {'note': 'Password reset attempted - manual verification recommended'}
-                    }
+            return await self._check_password_reset(email, 'onlyfans_email')
         except Exception as e:
             self.logger.warning(f"OnlyFans email check failed for {email}: {str(e)} - skipping")
         
@@ -272,14 +353,11 @@ class EmailHunter:
             # Check via signup page
             url = "https://pornhub.com/signup"
             
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'Accept': 'text/html,application/xhtml+xml,application/xml;q=0.9,*/*;q=0.8'
-            }
+            headers = next(self._headers['pornhub'])
             
             timeout = aiohttp.ClientTimeout(total=5)
             
-            async with self.session.get(url, headers=headers, timeout=timeout) as response:
+            async with self._request('GET', url, headers=headers, timeout=timeout) as response:
                 if response.status == 200:
                     # Note: Most adult sites don't expose email existence for privacy
                     # This is a placeholder for demonstration
@@ -292,30 +370,7 @@ class EmailHunter:
     async def check_chaturbate_email(self, email: str) -> Optional[Dict[str, Any]]:
         """Check if email is associated with Chaturbate account"""
         try:
-            # Chaturbate password reset check
-            url = "https://chaturbate.com/auth/password_reset/"
-            data = {'email': email}
-            
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'Content-Type': 'application/x-www-form-urlencoded',
-                'Referer': 'https://chaturbate.com/auth/login/'
-            }
-            
-            timeout = aiohttp.ClientTimeout(total=5)
-            
-            async with self.session.post(url, data=data, headers=headers, timeout=timeout) as response:
-                content = await response.text()
-                
-                # Check for account existence indicators
-                if any(indicator in content.lower() for indicator in ['reset', 'email', 'sent']):
-                    return {
-                        'platform': 'chaturbate',
-                        'email': email,
-                        'exists': True,
-                        'account_type': 'Chaturbate Account',
-                        'additional_info': {'note': 'Password reset attempted'}
-                    }
+            return await self._check_password_reset(email, 'chaturbate_email')
         except Exception as e:
             self.logger.warning(f"Chaturbate email check failed for {email}: {str(e)} - skipping")
         
@@ -327,14 +382,11 @@ class EmailHunter:
             # GitHub doesn't directly expose email searches, but we can try commits
             url = f"https://api.github.com/search/commits?q=author-email:{email}"
             
-            headers = {
-                'User-Agent': random.choice(self.config.user_agents),
-                'Accept': 'application/vnd.github.cloak-preview'
-            }
+            headers = next(self._headers['github'])
             
-            async with self.session.get(url, headers=headers) as response:
+            async with self._request('GET', url, headers=headers) as response:
                 if response.status == 200:
-                    result = await response.json()
+                    result = await response.json(loads=json_loads)
                     if result.get('total_count', 0) > 0:
                         commits = result.get('items', [])
                         if commits:
@@ -356,9 +408,22 @@ class EmailHunter:
         
         return None
     
+    async def resolve_records(self, domain: str, record_type: str) -> List[str]:
+        """Resolve DNS records of one type, returning an empty list on failure"""
+        try:
+            answer = await _get_resolver().resolve(domain, record_type)
+            return [str(record) for record in answer]
+        except Exception:
+            return []
+    
     async def analyze_domain(self, email: str) -> Dict[str, Any]:
         """Analyze the domain of the email address"""
-        domain = email.split('@')[1] if '@' in email else email
+        domain = (email.split('@')[1] if '@' in email else email).lower()
+        
+        # Emails on the same domain share one analysis
+        cached = _domain_cache.get(domain)
+        if cached and cached[0] > time.monotonic():
+            return copy.deepcopy(cached[1])
         
         domain_info = {
             'domain': domain,
@@ -373,44 +438,26 @@ class EmailHunter:
         }
         
         try:
-            # DNS lookups
-            try:
-                mx_records = dns.resolver.resolve(domain, 'MX')
-                domain_info['mx_records'] = [str(record) for record in mx_records]
-            except:
-                pass
-            
-            try:
-                a_records = dns.resolver.resolve(domain, 'A')
-                domain_info['a_records'] = [str(record) for record in a_records]
-            except:
-                pass
-            
-            try:
-                ns_records = dns.resolver.resolve(domain, 'NS')
-                domain_info['ns_records'] = [str(record) for record in ns_records]
-            except:
-                pass
-            
-            try:
-                txt_records = dns.resolver.resolve(domain, 'TXT')
-                domain_info['txt_records'] = [str(record) for record in txt_records]
-            except:
-                pass
+            # DNS lookups, run concurrently without blocking the event loop
+            (
+                domain_info['mx_records'],
+                domain_info['a_records'],
+                domain_info['ns_records'],
+                domain_info['txt_records']
+            ) = await asyncio.gather(
+                self.resolve_records(domain, 'MX'),
+                self.resolve_records(domain, 'A'),
+                self.resolve_records(domain, 'NS'),
+                self.resolve_records(domain, 'TXT')
+            )
             
             # Check if it's a known disposable email domain
-            disposable_domains = [
-                '10minutemail.com', 'temp-mail.org', 'guerrillamail.com',
-                'mailinator.com', 'yopmail.com', 'tempmail.net'
-            ]
-            domain_info['is_disposable'] = domain in disposable_domains
+            domain_info['is_disposable'] = domain in _DISPOSABLE_DOMAINS
             
             # Check if it's a corporate domain (not free email providers)
-            free_providers = [
-                'gmail.com', 'yahoo.com', 'hotmail.com', 'outlook.com',
-                'aol.com', 'icloud.com', 'protonmail.com'
-            ]
-            domain_info['is_corporate'] = domain not in free_providers and not domain_info['is_disposable']
+            domain_info['is_corporate'] = domain not in _FREE_PROVIDERS and not domain_info['is_disposable']
+            
+            _domain_cache[domain] = (time.monotonic() + _DOMAIN_CACHE_TTL, copy.deepcopy(domain_info))
             
         except Exception as e:
             self.logger.error(f"Error analyzing domain {domain}: {str(e)}")
@@ -426,7 +473,7 @@ class EmailHunter:
         
         results = []
         
-        # Check various platforms
+        # Check various platforms concurrently; each one is a different host
         checks = [
             self.check_gravatar(email),
             self.check_microsoft_account(email),
@@ -436,16 +483,11 @@ class EmailHunter:
             self.check_chaturbate_email(email)
         ]
         
-        for check in checks:
-            try:
-                result = await check
-                if result and result.get('exists'):
-                    results.append(result)
-                    
-                # Add delay between checks
-                await asyncio.sleep(self.config.delay_between_requests)
-            except Exception as e:
-                self.logger.error(f"Error in social account check: {str(e)}")
+        for result in await asyncio.gather(*checks, return_exceptions=True):
+            if isinstance(result, Exception):
+                self.logger.error(f"Error in social account check: {str(result)}")
+            elif result and result.get('exists'):
+                results.append(result)
         
         return results
     
@@ -487,25 +529,30 @@ class EmailHunter:
         return results
     
     async def hunt_all_accounts(self, email: str) -> Dict[str, Any]:
-        """Hunt for all types of accounts associated with email"""
+        """Hunt for all types of accounts associated with email
+        
+        The session stays open for further hunts; call aclose() when done.
+        """
         self.logger.info(f"Starting comprehensive email hunt for: {email}")
         
-        try:
-            results = {
-                'email': email,
-                'social_accounts': await self.hunt_social_accounts(email),
-                'professional_accounts': await self.hunt_professional_accounts(email),
-                'domain_analysis': await self.analyze_domain(email),
-                'paste_results': []  # Limited without API access
-            }
-            
-            total_found = len(results['social_accounts']) + len(results['professional_accounts'])
-            self.logger.info(f"Total accounts found for {email}: {total_found}")
-            
-            return results
-        finally:
-            # Ensure session is closed properly
-            try:
-                await self.close_session()
-            except Exception as e:
-                self.logger.warning(f"Error closing session: {str(e)}")
\ No newline at end of file
+        if not self.session:
+            await self.create_session()
+        
+        social_accounts, professional_accounts, domain_analysis = await asyncio.gather(
+            self.hunt_social_accounts(email),
+            self.hunt_professional_accounts(email),
+            self.analyze_domain(email)
+        )
+        
+        results = {
+            'email': email,
+            'social_accounts': social_accounts,
+            'professional_accounts': professional_accounts,
+            'domain_analysis': domain_analysis,
+            'paste_results': []  # Limited without API access
+        }
+        
+        total_found = len(results['social_accounts']) + len(results['professional_accounts'])
+        self.logger.info(f"Total accounts found for {email}: {total_found}")
+        
+        return results
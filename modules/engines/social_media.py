@@ -7,14 +7,14 @@ import aiohttp
 import random
 from typing import List, Dict, Any
 from urllib.parse import urljoin
-from core.config import Config
+from core.config import get_config
 from core.logger import get_logger
 
 class SocialMediaHunter:
     """Hunt for usernames across social media platforms"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = get_logger()
         self.session = None
         
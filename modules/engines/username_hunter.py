@@ -6,14 +6,14 @@ import asyncio
 import aiohttp
 import random
 from typing import List, Dict, Any
-from core.config import Config
+from core.config import get_config
 from core.logger import get_logger
 
 class UsernameHunter:
     """Hunt for usernames across general platforms"""
     
     def __init__(self):
-        self.config = Config()
+        self.config = get_config()
         self.logger = get_logger()
         self.session = None
         